@@ -21,6 +21,9 @@ class CyclePredictionAdmin(admin.ModelAdmin):
     list_filter = ['is_active', 'algorithm_used', 'created_at']
     search_fields = ['user__email']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
+    list_per_page = 50
 
     fieldsets = (
         ('User', {'fields': ('user',)}),
@@ -60,6 +63,9 @@ class CycleStatisticsAdmin(admin.ModelAdmin):
     ]
     search_fields = ['user__email']
     readonly_fields = ['last_calculated', 'created_at']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
+    list_per_page = 50
 
     fieldsets = (
         ('User', {'fields': ('user',)}),
@@ -101,6 +107,9 @@ class InsightAdmin(admin.ModelAdmin):
     list_filter = ['category', 'priority', 'is_read', 'is_dismissed', 'created_at']
     search_fields = ['user__email', 'title', 'description']
     readonly_fields = ['created_at', 'read_at']
+    list_select_related = ['user']
+    autocomplete_fields = ['user']
+    list_per_page = 50
 
     fieldsets = (
         ('User', {'fields': ('user',)}),
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cycleprediction',
+            name='cycle_predi_user_id_b9bb44_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='cycleprediction',
+            name='cycle_predi_user_id_85882a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='cycleprediction',
+            index=models.Index(fields=['user', 'is_active', '-predicted_period_start'], name='pred_user_active_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cycleprediction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', '-predicted_period_start'], name='pred_active_only_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='insight',
+            index=models.Index(condition=models.Q(('is_dismissed', False), ('is_read', False)), fields=['user', '-created_at'], name='insight_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:11
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def scores_to_percent(apps, schema_editor):
+    """Rescale stored 0-1 scores to 0-100 before the column becomes an integer."""
+    apps.get_model('analytics', 'CyclePrediction').objects.update(confidence_score=F('confidence_score') * 100)
+    apps.get_model('analytics', 'CycleStatistics').objects.update(cycle_regularity_score=F('cycle_regularity_score') * 100)
+
+
+def scores_to_fraction(apps, schema_editor):
+    """Rescale 0-100 scores back to 0-1."""
+    apps.get_model('analytics', 'CyclePrediction').objects.update(confidence_score=F('confidence_score') / 100)
+    apps.get_model('analytics', 'CycleStatistics').objects.update(cycle_regularity_score=F('cycle_regularity_score') / 100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_remove_cycleprediction_cycle_predi_user_id_b9bb44_idx_and_more'),
+    ]
+
+    operations = [
+        # Widen the decimals so 100 fits while the values are rescaled
+        migrations.AlterField(
+            model_name='cycleprediction',
+            name='confidence_score',
+            field=models.DecimalField(max_digits=5, decimal_places=2, default=0.0),
+        ),
+        migrations.AlterField(
+            model_name='cyclestatistics',
+            name='cycle_regularity_score',
+            field=models.DecimalField(max_digits=5, decimal_places=2, default=0.0),
+        ),
+        migrations.RunPython(scores_to_percent, scores_to_fraction),
+        migrations.AlterField(
+            model_name='cycleprediction',
+            name='confidence_score',
+            field=models.SmallIntegerField(default=50),
+        ),
+        migrations.AlterField(
+            model_name='cyclestatistics',
+            name='cycle_regularity_score',
+            field=models.SmallIntegerField(default=50),
+        ),
+    ]
@@ -21,7 +21,7 @@ class CyclePrediction(models.Model):
     predicted_fertile_window_end = models.DateField(null=True, blank=True)
 
     # Prediction metadata
-    confidence_score = models.DecimalField(max_digits=3, decimal_places=2, default=0.0)
+    confidence_score = models.SmallIntegerField(default=50)  # percent, 0-100
     algorithm_used = models.CharField(max_length=50, default='average')
     based_on_cycles_count = models.IntegerField(default=0)
 
@@ -39,8 +39,12 @@ class CyclePrediction(models.Model):
         verbose_name_plural = 'Cycle Predictions'
         ordering = ['-predicted_period_start']
         indexes = [
-            models.Index(fields=['user', '-predicted_period_start']),
-            models.Index(fields=['user', 'is_active']),
+            models.Index(fields=['user', 'is_active', '-predicted_period_start'], name='pred_user_active_start_idx'),
+            models.Index(
+                fields=['user', '-predicted_period_start'],
+                condition=models.Q(is_active=True),
+                name='pred_active_only_idx',
+            ),
         ]
 
     def __str__(self):
@@ -64,7 +68,7 @@ class CycleStatistics(models.Model):
     average_cycle_length = models.DecimalField(max_digits=5, decimal_places=2, default=0)
     shortest_cycle_length = models.IntegerField(default=0)
     longest_cycle_length = models.IntegerField(default=0)
-    cycle_regularity_score = models.DecimalField(max_digits=3, decimal_places=2, default=0.0)
+    cycle_regularity_score = models.SmallIntegerField(default=50)  # percent, 0-100
 
     # Period statistics
     average_period_length = models.DecimalField(max_digits=4, decimal_places=2, default=0)
@@ -135,6 +139,11 @@ class Insight(models.Model):
         indexes = [
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['user', 'is_read']),
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(is_dismissed=False, is_read=False),
+                name='insight_unread_idx',
+            ),
         ]
 
     def __str__(self):
@@ -66,6 +66,24 @@ class InsightSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'category', 'priority', 'title', 'description', 'created_at']
 
 
+class InsightListSerializer(serializers.ModelSerializer):
+    """Lightweight serializer for insight lists (omits description)."""
+
+    class Meta:
+        model = Insight
+        fields = [
+            'id',
+            'category',
+            'priority',
+            'title',
+            'is_read',
+            'is_dismissed',
+            'created_at',
+            'read_at',
+        ]
+        read_only_fields = fields
+
+
 class InsightUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating insight status."""
 
@@ -4,22 +4,148 @@ Business logic services for analytics and predictions.
 
 from datetime import timedelta
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
+from statistics import pstdev
 from typing import Optional, Dict, Any
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Max, Min, Q, StdDev, Window
+from django.db.models.functions import ExtractDay, Lead
 from django.utils import timezone
 
 from modules.cycles.models import Cycle, DailyLog
 from .models import CyclePrediction, CycleStatistics, Insight
 
+# Settings are fixed for the life of the process, so read them once
+_MIN_CYCLES_FOR_PREDICTION = settings.ANALYTICS_CONFIG.get('MIN_CYCLES_FOR_PREDICTION', 3)
+_DEFAULT_CYCLE_LENGTH = settings.CYCLE_TRACKING_CONFIG.get('DEFAULT_CYCLE_LENGTH', 28)
+
+# Columns rewritten when a user's statistics row already exists
+_STATISTICS_UPSERT_FIELDS = [
+    'average_cycle_length',
+    'shortest_cycle_length',
+    'longest_cycle_length',
+    'cycle_regularity_score',
+    'average_period_length',
+    'shortest_period_length',
+    'longest_period_length',
+    'total_cycles_tracked',
+    'complete_cycles_count',
+    'last_calculated',
+]
+
+# Serialized predictions/statistics are cached until the services recompute them
+ANALYTICS_CACHE_TIMEOUT = 60 * 60
+
+
+def active_prediction_cache_key(user_id) -> str:
+    """Cache key for a user's serialized active prediction."""
+    return f'pred:active:{user_id}'
+
+
+def statistics_cache_key(user_id) -> str:
+    """Cache key for a user's serialized cycle statistics."""
+    return f'stats:{user_id}'
+
+
+def _cycle_length_aggregates(user) -> Dict[str, Any]:
+    """
+    Aggregate a user's cycle lengths in a single query.
+
+    Cycle length is the number of days from one cycle's start date to the
+    next cycle's start date. Returns ``avg``, ``std``, ``shortest``,
+    ``longest`` and ``count`` over those lengths, plus ``cycles`` (number of
+    cycles tracked), ``last_start`` (most recent start date) and
+    ``avg_period`` (mean of the recorded period lengths).
+
+    Completed cycles (those with an end date) are summarised as ``complete``
+    and ``period_avg``, ``period_shortest`` and ``period_longest``, where a
+    period runs from start date to end date inclusive.
+    """
+    cycles = Cycle.objects.filter(user=user).annotate(
+        next_start=Window(expression=Lead('start_date'), order_by=F('start_date').asc()),
+    ).annotate(
+        length=ExtractDay(ExpressionWrapper(F('next_start') - F('start_date'), output_field=DurationField())),
+        period_span=ExtractDay(ExpressionWrapper(F('end_date') - F('start_date'), output_field=DurationField())) + 1,
+    )
+    return cycles.aggregate(
+        avg=Avg('length'),
+        std=StdDev('length'),
+        shortest=Min('length'),
+        longest=Max('length'),
+        count=Count('length'),
+        cycles=Count('id'),
+        last_start=Max('start_date'),
+        avg_period=Avg('period_length', filter=Q(period_length__gt=0)),
+        complete=Count('id', filter=Q(end_date__isnull=False)),
+        period_avg=Avg('period_span'),
+        period_shortest=Min('period_span'),
+        period_longest=Max('period_span'),
+    )
+
+
+def _cycle_length_aggregates_by_user():
+    """
+    Yield ``(user_id, aggregates)`` for every user with cycles.
+
+    All users' cycles are streamed from one query, with the next start date
+    computed per user by a window function. ``aggregates`` has the same keys
+    as ``_cycle_length_aggregates``.
+    """
+    rows = Cycle.objects.annotate(
+        next_start=Window(
+            expression=Lead('start_date'),
+            partition_by=F('user_id'),
+            order_by=F('start_date').asc(),
+        ),
+    ).order_by('user_id', 'start_date').values_list(
+        'user_id', 'start_date', 'end_date', 'next_start', 'period_length'
+    )
+
+    for user_id, user_rows in groupby(rows.iterator(chunk_size=2000), key=itemgetter(0)):
+        cycles = 0
+        last_start = None
+        lengths = []
+        recorded_periods = []
+        period_lengths = []
+        for _, start, end, next_start, period_length in user_rows:
+            cycles += 1
+            last_start = start
+            if next_start is not None:
+                lengths.append((next_start - start).days)
+            if period_length:
+                recorded_periods.append(period_length)
+            if end:
+                period_lengths.append((end - start).days + 1)
+
+        aggregates = {
+            'avg': sum(lengths) / len(lengths) if lengths else None,
+            'std': pstdev(lengths) if lengths else None,
+            'shortest': min(lengths, default=None),
+            'longest': max(lengths, default=None),
+            'count': len(lengths),
+            'cycles': cycles,
+            'last_start': last_start,
+            'avg_period': sum(recorded_periods) / len(recorded_periods) if recorded_periods else None,
+            'complete': len(period_lengths),
+            'period_avg': sum(period_lengths) / len(period_lengths) if period_lengths else None,
+            'period_shortest': min(period_lengths, default=None),
+            'period_longest': max(period_lengths, default=None),
+        }
+        yield user_id, aggregates
+
 
 class PredictionService:
     """
     Service for generating cycle predictions.
     """
 
+    min_cycles = _MIN_CYCLES_FOR_PREDICTION
+
     def __init__(self, user):
         self.user = user
-        self.min_cycles = settings.ANALYTICS_CONFIG.get('MIN_CYCLES_FOR_PREDICTION', 3)
 
     def generate_prediction(self) -> Optional[CyclePrediction]:
         """
@@ -28,32 +154,59 @@ class PredictionService:
         Returns:
             CyclePrediction object or None if insufficient data
         """
-        # Get all cycles ordered by start date (oldest to newest)
-        all_cycles = list(Cycle.objects.filter(
-            user=self.user
-        ).order_by('start_date'))
-
-        if len(all_cycles) < self.min_cycles:
+        prediction = self._build_prediction(self.user.pk, _cycle_length_aggregates(self.user))
+        if prediction is None:
             return None
 
-        # Calculate actual cycle lengths by comparing consecutive start dates
-        cycle_lengths = []
-        for i in range(len(all_cycles) - 1):
-            current_cycle = all_cycles[i]
-            next_cycle = all_cycles[i + 1]
-            # Cycle length is from start of this cycle to start of next cycle
-            length = (next_cycle.start_date - current_cycle.start_date).days
-            cycle_lengths.append(length)
+        # Swap the active prediction atomically so readers never see zero or two
+        with transaction.atomic():
+            CyclePrediction.objects.filter(user=self.user, is_active=True).update(is_active=False)
+            prediction.save()
+        cache.delete_many([active_prediction_cache_key(self.user.pk), statistics_cache_key(self.user.pk)])
+
+        return prediction
+
+    @classmethod
+    def regenerate_all(cls) -> int:
+        """
+        Regenerate the active prediction for every user with enough cycle data.
+
+        Intended for background jobs: reads all cycles in one query and writes
+        the new predictions with a single bulk insert.
+
+        Returns:
+            Number of predictions created
+        """
+        predictions = [
+            prediction
+            for user_id, aggregates in _cycle_length_aggregates_by_user()
+            if (prediction := cls._build_prediction(user_id, aggregates)) is not None
+        ]
+        user_ids = [prediction.user_id for prediction in predictions]
+
+        with transaction.atomic():
+            CyclePrediction.objects.filter(user_id__in=user_ids, is_active=True).update(is_active=False)
+            CyclePrediction.objects.bulk_create(predictions, batch_size=500)
+        cache.delete_many(
+            [key for user_id in user_ids for key in (active_prediction_cache_key(user_id), statistics_cache_key(user_id))]
+        )
+
+        return len(predictions)
+
+    @classmethod
+    def _build_prediction(cls, user_id, aggregates: Dict[str, Any]) -> Optional[CyclePrediction]:
+        """Build an unsaved active prediction from cycle aggregates, or None if insufficient data."""
+        if aggregates['cycles'] < cls.min_cycles:
+            return None
 
-        if not cycle_lengths:
+        if not aggregates['count']:
             return None
 
-        avg_cycle_length = sum(cycle_lengths) / len(cycle_lengths)
-        avg_period_length = self._calculate_average_period_length(all_cycles)
+        avg_cycle_length = aggregates['avg']
+        avg_period_length = aggregates['avg_period'] or _DEFAULT_CYCLE_LENGTH
 
-        # Get last (most recent) cycle start date
-        last_cycle = all_cycles[-1]  # Last item in ordered list
-        predicted_start = last_cycle.start_date + timedelta(days=int(avg_cycle_length))
+        # Predict from the last (most recent) cycle start date
+        predicted_start = aggregates['last_start'] + timedelta(days=int(avg_cycle_length))
         predicted_end = predicted_start + timedelta(days=int(avg_period_length) - 1)
 
         # Calculate ovulation (typically 14 days before next period)
@@ -62,14 +215,10 @@ class PredictionService:
         fertile_window_end = predicted_ovulation + timedelta(days=2)
 
         # Calculate confidence score based on cycle regularity
-        confidence = self._calculate_confidence(cycle_lengths)
+        confidence = cls._calculate_confidence(aggregates['std'], aggregates['count'])
 
-        # Deactivate old predictions
-        CyclePrediction.objects.filter(user=self.user, is_active=True).update(is_active=False)
-
-        # Create new prediction
-        prediction = CyclePrediction.objects.create(
-            user=self.user,
+        return CyclePrediction(
+            user_id=user_id,
             predicted_period_start=predicted_start,
             predicted_period_end=predicted_end,
             predicted_ovulation_date=predicted_ovulation,
@@ -77,37 +226,25 @@ class PredictionService:
             predicted_fertile_window_end=fertile_window_end,
             confidence_score=confidence,
             algorithm_used='average',
-            based_on_cycles_count=len(cycle_lengths),
+            based_on_cycles_count=aggregates['count'],
             is_active=True,
         )
 
-        return prediction
-
-    def _calculate_average_period_length(self, cycles) -> int:
-        """Calculate average period length from cycles."""
-        period_lengths = [c.period_length for c in cycles if c.period_length]
-        if period_lengths:
-            return int(sum(period_lengths) / len(period_lengths))
-        return settings.CYCLE_TRACKING_CONFIG.get('DEFAULT_CYCLE_LENGTH', 28)
-
-    def _calculate_confidence(self, cycle_lengths: list) -> Decimal:
+    @staticmethod
+    def _calculate_confidence(std_dev: float, count: int) -> int:
         """
         Calculate confidence score based on cycle regularity.
 
-        Returns value between 0 and 1.
+        Takes the standard deviation and number of cycle lengths.
+        Returns a percentage between 0 and 100.
         """
-        if len(cycle_lengths) < 2:
-            return Decimal('0.5')
-
-        # Calculate standard deviation
-        mean = sum(cycle_lengths) / len(cycle_lengths)
-        variance = sum((x - mean) ** 2 for x in cycle_lengths) / len(cycle_lengths)
-        std_dev = variance ** 0.5
+        if count < 2:
+            return 50
 
         # Lower std dev = higher confidence
-        # Assuming std dev of 0 = confidence 1.0, std dev of 7+ = confidence 0.0
+        # Assuming std dev of 0 = confidence 100, std dev of 7+ = confidence 0
         confidence = max(0, 1 - (std_dev / 7))
-        return Decimal(str(round(confidence, 2)))
+        return int(round(confidence * 100))
 
 
 class StatisticsService:
@@ -118,64 +255,102 @@ class StatisticsService:
     def __init__(self, user):
         self.user = user
 
+    def compute_statistics(self) -> CycleStatistics:
+        """
+        Compute the user's cycle statistics in one query without saving them.
+        """
+        return self._build_statistics(self.user.pk, _cycle_length_aggregates(self.user))
+
     def calculate_statistics(self) -> CycleStatistics:
         """
         Calculate or update cycle statistics for the user.
         """
-        # Get all cycles ordered by start date
-        all_cycles = list(Cycle.objects.filter(user=self.user).order_by('start_date'))
-
-        # Get or create statistics object
-        stats, _ = CycleStatistics.objects.get_or_create(user=self.user)
-
-        # Calculate actual cycle lengths from consecutive start dates
-        if len(all_cycles) >= 2:
-            cycle_lengths = []
-            for i in range(len(all_cycles) - 1):
-                current_cycle = all_cycles[i]
-                next_cycle = all_cycles[i + 1]
-                length = (next_cycle.start_date - current_cycle.start_date).days
-                cycle_lengths.append(length)
-
-            if cycle_lengths:
-                stats.average_cycle_length = Decimal(str(round(sum(cycle_lengths) / len(cycle_lengths), 2)))
-                stats.shortest_cycle_length = min(cycle_lengths)
-                stats.longest_cycle_length = max(cycle_lengths)
-                stats.cycle_regularity_score = self._calculate_regularity_score(cycle_lengths)
-
-            # Calculate period statistics from end_date (which represents period end)
-            # Period length = days from start to end of period
-            period_lengths = []
-            for cycle in all_cycles:
-                if cycle.end_date:
-                    period_len = (cycle.end_date - cycle.start_date).days + 1
-                    period_lengths.append(period_len)
-
-            if period_lengths:
-                stats.average_period_length = Decimal(str(round(sum(period_lengths) / len(period_lengths), 2)))
-                stats.shortest_period_length = min(period_lengths)
-                stats.longest_period_length = max(period_lengths)
-
-        stats.total_cycles_tracked = len(all_cycles)
-        stats.complete_cycles_count = sum(1 for c in all_cycles if c.end_date)
-        stats.save()
+        stats = self.compute_statistics()
+        self._upsert([stats])
+
+        cache.delete(statistics_cache_key(self.user.pk))
 
         return stats
 
-    def _calculate_regularity_score(self, cycle_lengths: list) -> Decimal:
+    @classmethod
+    def regenerate_all(cls) -> int:
+        """
+        Recalculate statistics for every user with cycles.
+
+        Intended for background jobs: reads all cycles in one query and
+        upserts every statistics row in bulk.
+
+        Returns:
+            Number of statistics rows written
+        """
+        statistics = [
+            cls._build_statistics(user_id, aggregates)
+            for user_id, aggregates in _cycle_length_aggregates_by_user()
+        ]
+        cls._upsert(statistics)
+        cache.delete_many([statistics_cache_key(stats.user_id) for stats in statistics])
+
+        return len(statistics)
+
+    @staticmethod
+    def _upsert(statistics) -> None:
         """
-        Calculate a regularity score (0-1) based on cycle length variance.
+        Write statistics rows with INSERT ... ON CONFLICT DO UPDATE.
+
+        Fields not computed by ``_build_statistics`` are reset to their
+        defaults, so each row always matches the object that was written.
         """
-        if len(cycle_lengths) < 2:
-            return Decimal('0.5')
+        CycleStatistics.objects.bulk_create(
+            statistics,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=_STATISTICS_UPSERT_FIELDS,
+        )
+
+    @classmethod
+    def _build_statistics(cls, user_id, aggregates: Dict[str, Any]) -> CycleStatistics:
+        """Build an unsaved statistics row from cycle aggregates."""
+        fields = {
+            'total_cycles_tracked': aggregates['cycles'],
+            'complete_cycles_count': aggregates['complete'],
+        }
+
+        # Cycle lengths come from consecutive start dates
+        if aggregates['cycles'] >= 2:
+            if aggregates['count']:
+                fields.update({
+                    'average_cycle_length': Decimal(str(round(aggregates['avg'], 2))),
+                    'shortest_cycle_length': aggregates['shortest'],
+                    'longest_cycle_length': aggregates['longest'],
+                    'cycle_regularity_score': cls._calculate_regularity_score(
+                        aggregates['std'], aggregates['count']
+                    ),
+                })
+
+            # Period statistics come from end_date (which represents period end)
+            if aggregates['complete']:
+                fields.update({
+                    'average_period_length': Decimal(str(round(aggregates['period_avg'], 2))),
+                    'shortest_period_length': aggregates['period_shortest'],
+                    'longest_period_length': aggregates['period_longest'],
+                })
 
-        mean = sum(cycle_lengths) / len(cycle_lengths)
-        variance = sum((x - mean) ** 2 for x in cycle_lengths) / len(cycle_lengths)
-        std_dev = variance ** 0.5
+        return CycleStatistics(user_id=user_id, **fields)
+
+    @staticmethod
+    def _calculate_regularity_score(std_dev: float, count: int) -> int:
+        """
+        Calculate a regularity score (0-100) based on cycle length variance.
+
+        Takes the standard deviation and number of cycle lengths.
+        """
+        if count < 2:
+            return 50
 
         # Lower variance = higher regularity
         regularity = max(0, 1 - (std_dev / 10))
-        return Decimal(str(round(regularity, 2)))
+        return int(round(regularity * 100))
 
 
 class InsightService:
@@ -195,7 +370,7 @@ class InsightService:
         # Check cycle regularity
         stats = CycleStatistics.objects.filter(user=self.user).first()
         if stats and stats.total_cycles_tracked >= 3:
-            if stats.cycle_regularity_score < Decimal('0.5'):
+            if stats.cycle_regularity_score < 50:
                 insights.append({
                     'category': 'cycle',
                     'priority': 'medium',
@@ -208,16 +383,19 @@ class InsightService:
                 })
 
         # Check for common symptom patterns
+        # Mood counts over the 30 most recent logs, grouped in SQL
+        # (logs without a mood are counted under None)
         recent_logs = DailyLog.objects.filter(user=self.user).order_by('-date')[:30]
-        if recent_logs.exists():
-            mood_counts = {}
-            for log in recent_logs:
-                if log.mood:
-                    mood_counts[log.mood] = mood_counts.get(log.mood, 0) + 1
-
+        mood_counts = dict(
+            DailyLog.objects.filter(pk__in=recent_logs.values('pk'))
+            .values_list('mood')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        if mood_counts:
             # If predominantly bad moods
             bad_moods = mood_counts.get('bad', 0) + mood_counts.get('terrible', 0)
-            if bad_moods > len(recent_logs) * 0.5:
+            if bad_moods > sum(mood_counts.values()) * 0.5:
                 insights.append({
                     'category': 'mood',
                     'priority': 'high',
@@ -228,12 +406,11 @@ class InsightService:
                     ),
                 })
 
-        # Create insight records
-        for insight_data in insights:
-            Insight.objects.create(
-                user=self.user,
-                **insight_data,
-                based_on_data_until=timezone.now().date()
-            )
+        # Create insight records in a single INSERT
+        today = timezone.localdate()
+        Insight.objects.bulk_create(
+            [Insight(user=self.user, based_on_data_until=today, **insight_data) for insight_data in insights],
+            batch_size=500,
+        )
 
         return insights
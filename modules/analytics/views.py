@@ -2,11 +2,14 @@
 Views for the Analytics module.
 """
 
+from decimal import Decimal
+
 from rest_framework import status, viewsets
 from rest_framework.decorators import api_view, action, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
+from django.core.cache import cache
 from django.utils import timezone
 
 from .models import CyclePrediction, CycleStatistics, Insight
@@ -14,12 +17,29 @@ from .serializers import (
     CyclePredictionSerializer,
     CycleStatisticsSerializer,
     InsightSerializer,
+    InsightListSerializer,
     InsightUpdateSerializer,
 )
-from .services import PredictionService, StatisticsService, InsightService
+from .services import (
+    PredictionService,
+    StatisticsService,
+    InsightService,
+    ANALYTICS_CACHE_TIMEOUT,
+    active_prediction_cache_key,
+    statistics_cache_key,
+)
 from shared.utils import format_response
 
 
+def _values_to_representation(row):
+    """
+    Render a ``.values()`` row the way the read-only ModelSerializers do.
+
+    Decimals become strings; dates and datetimes are left to the JSON renderer.
+    """
+    return {key: str(value) if isinstance(value, Decimal) else value for key, value in row.items()}
+
+
 @extend_schema(tags=['Analytics'])
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -27,15 +47,20 @@ def get_current_prediction(request):
     """
     Get the current active prediction for the user.
     """
-    try:
-        prediction = CyclePrediction.objects.get(user=request.user, is_active=True)
-        serializer = CyclePredictionSerializer(prediction)
-        return Response(format_response(serializer.data), status=status.HTTP_200_OK)
-    except CyclePrediction.DoesNotExist:
-        return Response(
-            {'success': False, 'message': 'No active prediction found. Generate one first.'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    cache_key = active_prediction_cache_key(request.user.pk)
+    data = cache.get(cache_key)
+    if data is None:
+        prediction = CyclePrediction.objects.filter(user=request.user, is_active=True).values(
+            *CyclePredictionSerializer.Meta.fields
+        ).first()
+        if prediction is None:
+            return Response(
+                {'success': False, 'message': 'No active prediction found. Generate one first.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        data = _values_to_representation(prediction)
+        cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+    return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=['Analytics'])
@@ -71,15 +96,20 @@ def get_statistics(request):
     """
     Get cycle statistics for the user.
     """
-    try:
-        statistics = CycleStatistics.objects.get(user=request.user)
-        serializer = CycleStatisticsSerializer(statistics)
-        return Response(format_response(serializer.data), status=status.HTTP_200_OK)
-    except CycleStatistics.DoesNotExist:
-        return Response(
-            {'success': False, 'message': 'No statistics available. Calculate them first.'},
-            status=status.HTTP_404_NOT_FOUND
-        )
+    cache_key = statistics_cache_key(request.user.pk)
+    data = cache.get(cache_key)
+    if data is None:
+        statistics = CycleStatistics.objects.filter(user=request.user).values(
+            *CycleStatisticsSerializer.Meta.fields
+        ).first()
+        if statistics is None:
+            return Response(
+                {'success': False, 'message': 'No statistics available. Calculate them first.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        data = _values_to_representation(statistics)
+        cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+    return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=['Analytics'])
@@ -108,25 +138,33 @@ class InsightViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return insights for the current user only."""
-        return Insight.objects.filter(user=self.request.user)
+        queryset = Insight.objects.filter(user=self.request.user)
+        if self.action == 'list':
+            # Lists skip the (potentially long) description column
+            return queryset.only(*InsightListSerializer.Meta.fields)
+        return queryset
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action in ['update', 'partial_update', 'mark_as_read', 'dismiss']:
             return InsightUpdateSerializer
+        if self.action == 'list':
+            return InsightListSerializer
         return InsightSerializer
 
     @extend_schema(tags=['Insights'])
     def list(self, request, *args, **kwargs):
         """List all insights for the current user."""
         queryset = self.get_queryset().filter(is_dismissed=False)
-        unread = queryset.filter(is_read=False)
 
         serializer = self.get_serializer(queryset, many=True)
+        insights = serializer.data
+
+        # Derive the unread count from the fetched page instead of a second COUNT query
         return Response(
             format_response({
-                'insights': serializer.data,
-                'unread_count': unread.count(),
+                'insights': insights,
+                'unread_count': sum(1 for insight in insights if not insight['is_read']),
             }),
             status=status.HTTP_200_OK
         )
@@ -4,6 +4,7 @@ Admin interface configuration for the Cycles module.
 
 from django.contrib import admin
 from .models import Cycle, PeriodDay, Symptom, DailyLog
+from shared.admin import LargeTablePaginator
 
 
 class PeriodDayInline(admin.TabularInline):
@@ -29,7 +30,9 @@ class CycleAdmin(admin.ModelAdmin):
     ]
     list_filter = ['is_active', 'start_date', 'created_at']
     search_fields = ['user__email']
+    ordering = ['-start_date']
     readonly_fields = ['cycle_length', 'created_at', 'updated_at']
+    list_select_related = ['user']
     inlines = [PeriodDayInline]
 
     fieldsets = (
@@ -46,8 +49,11 @@ class PeriodDayAdmin(admin.ModelAdmin):
 
     list_display = ['cycle', 'date', 'flow', 'created_at']
     list_filter = ['flow', 'date']
-    search_fields = ['cycle__user__email']
+    autocomplete_fields = ['cycle']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['cycle__user']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
 
 
 @admin.register(Symptom)
@@ -65,8 +71,11 @@ class DailyLogAdmin(admin.ModelAdmin):
 
     list_display = ['user', 'date', 'mood', 'temperature', 'created_at']
     list_filter = ['mood', 'date', 'sexual_activity']
-    search_fields = ['user__email', 'notes']
+    autocomplete_fields = ['user', 'cycle']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
     filter_horizontal = ['symptoms']
 
     fieldsets = (
@@ -14,5 +14,4 @@ class CyclesConfig(AppConfig):
 
     def ready(self):
         """Import signal handlers when the app is ready."""
-        # import modules.cycles.signals
-        pass
+        import modules.cycles.signals
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cycle',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user'], name='cycles_active_partial'),
+        ),
+    ]
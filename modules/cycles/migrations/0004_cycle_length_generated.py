@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:20
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0003_cycles_active_partial'),
+    ]
+
+    # A column cannot be altered into a generated column, so it is recreated;
+    # the database fills it in from the existing start and end dates
+    operations = [
+        migrations.RemoveField(
+            model_name='cycle',
+            name='cycle_length',
+        ),
+        migrations.AddField(
+            model_name='cycle',
+            name='cycle_length',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.Func(models.F('end_date'), models.F('start_date'), arg_joiner=' - ', template='(%(expressions)s)'), '+', models.Value(1)), output_field=models.IntegerField(blank=True, null=True)),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0004_cycle_length_generated'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cycle',
+            name='cycles_user_id_133638_idx',
+        ),
+        migrations.AddIndex(
+            model_name='periodday',
+            index=models.Index(fields=['cycle', 'flow', 'date'], name='pday_cycle_flow_date'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0005_period_day_flow_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='symptom',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'name'], name='symptoms_active_by_cat'),
+        ),
+    ]
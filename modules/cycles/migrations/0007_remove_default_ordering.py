@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0006_symptoms_active_by_cat'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='cycle',
+            options={'verbose_name': 'Cycle', 'verbose_name_plural': 'Cycles'},
+        ),
+        migrations.AlterModelOptions(
+            name='dailylog',
+            options={'verbose_name': 'Daily Log', 'verbose_name_plural': 'Daily Logs'},
+        ),
+        migrations.AlterModelOptions(
+            name='periodday',
+            options={'verbose_name': 'Period Day', 'verbose_name_plural': 'Period Days'},
+        ),
+    ]
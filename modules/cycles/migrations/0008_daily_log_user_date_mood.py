@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0007_remove_default_ordering'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailylog',
+            index=models.Index(fields=['user', 'date', 'mood'], name='dlog_user_date_mood'),
+        ),
+        migrations.RemoveIndex(
+            model_name='dailylog',
+            name='daily_logs_user_id_7a3a5d_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cycles', '0008_daily_log_user_date_mood'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cycle',
+            index=models.Index(fields=['user', '-start_date'], include=('end_date', 'cycle_length', 'period_length'), name='cycles_user_start_cover'),
+        ),
+        migrations.RemoveIndex(
+            model_name='cycle',
+            name='cycles_user_id_7a04a9_idx',
+        ),
+    ]
@@ -5,9 +5,23 @@ Models for cycle tracking.
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from seal.models import SealableModel
 
+# The id of a user's active cycle is cached until a cycle write changes it
+ACTIVE_CYCLE_CACHE_TIMEOUT = 60 * 5
 
-class Cycle(models.Model):
+
+def active_cycle_cache_key(user_id) -> str:
+    """Cache key for the id of a user's active cycle."""
+    return f'cycle:active:{user_id}'
+
+
+# The serialized symptom catalogue is cached until a symptom is saved or deleted
+SYMPTOMS_CACHE_KEY = 'symptoms:v1'
+SYMPTOMS_CACHE_TIMEOUT = 60 * 60
+
+
+class Cycle(SealableModel):
     """
     Represents a single menstrual cycle.
 
@@ -20,10 +34,13 @@ class Cycle(models.Model):
     end_date = models.DateField(null=True, blank=True, db_index=True)
 
     # Cycle metrics
-    cycle_length = models.IntegerField(
-        null=True,
-        blank=True,
-        validators=[MinValueValidator(21), MaxValueValidator(45)]
+    # Days from start to end date inclusive, computed by the database
+    cycle_length = models.GeneratedField(
+        expression=models.Func(
+            models.F('end_date'), models.F('start_date'), template='(%(expressions)s)', arg_joiner=' - '
+        ) + models.Value(1),
+        output_field=models.IntegerField(null=True, blank=True),
+        db_persist=True,
     )
     period_length = models.IntegerField(
         null=True,
@@ -43,25 +60,22 @@ class Cycle(models.Model):
         db_table = 'cycles'
         verbose_name = 'Cycle'
         verbose_name_plural = 'Cycles'
-        ordering = ['-start_date']
         unique_together = ['user', 'start_date']
         indexes = [
-            models.Index(fields=['user', '-start_date']),
-            models.Index(fields=['user', 'is_active']),
+            # Covers the chart queries' projections so they can be answered index-only
+            models.Index(
+                fields=['user', '-start_date'],
+                include=['end_date', 'cycle_length', 'period_length'],
+                name='cycles_user_start_cover',
+            ),
+            models.Index(fields=['user'], condition=models.Q(is_active=True), name='cycles_active_partial'),
         ]
 
     def __str__(self):
         return f"Cycle for {self.user.email} starting {self.start_date}"
 
-    def calculate_cycle_length(self):
-        """Calculate and update the cycle length if end date is set."""
-        if self.end_date:
-            self.cycle_length = (self.end_date - self.start_date).days + 1
-            return self.cycle_length
-        return None
-
 
-class PeriodDay(models.Model):
+class PeriodDay(SealableModel):
     """
     Represents a single day of menstruation within a cycle.
     """
@@ -86,10 +100,10 @@ class PeriodDay(models.Model):
         db_table = 'period_days'
         verbose_name = 'Period Day'
         verbose_name_plural = 'Period Days'
-        ordering = ['date']
         unique_together = ['cycle', 'date']
         indexes = [
             models.Index(fields=['cycle', 'date']),
+            models.Index(fields=['cycle', 'flow', 'date'], name='pday_cycle_flow_date'),
         ]
 
     def __str__(self):
@@ -119,12 +133,15 @@ class Symptom(models.Model):
         verbose_name = 'Symptom'
         verbose_name_plural = 'Symptoms'
         ordering = ['category', 'name']
+        indexes = [
+            models.Index(fields=['category', 'name'], condition=models.Q(is_active=True), name='symptoms_active_by_cat'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.category})"
 
 
-class DailyLog(models.Model):
+class DailyLog(SealableModel):
     """
     Daily log for tracking symptoms, moods, and other data.
 
@@ -165,10 +182,10 @@ class DailyLog(models.Model):
         db_table = 'daily_logs'
         verbose_name = 'Daily Log'
         verbose_name_plural = 'Daily Logs'
-        ordering = ['-date']
         unique_together = ['user', 'date']
         indexes = [
-            models.Index(fields=['user', '-date']),
+            # Covers the mood charts' (user, date range) scans index-only; also serves -date ordering
+            models.Index(fields=['user', 'date', 'mood'], name='dlog_user_date_mood'),
             models.Index(fields=['cycle', 'date']),
         ]
 
@@ -2,8 +2,11 @@
 Serializers for the Cycles module.
 """
 
+from django.core.cache import cache
+from django.db import transaction
 from rest_framework import serializers
-from .models import Cycle, PeriodDay, Symptom, DailyLog
+from drf_spectacular.utils import extend_schema_field
+from .models import Cycle, PeriodDay, Symptom, DailyLog, active_cycle_cache_key
 from shared.exceptions import ValidationException
 
 
@@ -14,6 +17,23 @@ class SymptomSerializer(serializers.ModelSerializer):
         model = Symptom
         fields = ['id', 'name', 'category', 'description']
 
+    def to_representation(self, instance):
+        """Build the read-only payload directly rather than walking every field."""
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'category': instance.category,
+            'description': instance.description,
+        }
+
+
+class NestedSymptomSerializer(serializers.ModelSerializer):
+    """Lightweight Symptom serializer for nesting (omits description)."""
+
+    class Meta:
+        model = Symptom
+        fields = ['id', 'name', 'category']
+
 
 class PeriodDaySerializer(serializers.ModelSerializer):
     """Serializer for PeriodDay model."""
@@ -23,6 +43,18 @@ class PeriodDaySerializer(serializers.ModelSerializer):
         fields = ['id', 'date', 'flow', 'notes', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    def to_representation(self, instance):
+        """Build the read-only payload directly; only timestamps go through their fields."""
+        fields = self.fields
+        return {
+            'id': instance.id,
+            'date': instance.date.isoformat(),
+            'flow': instance.flow,
+            'notes': instance.notes,
+            'created_at': fields['created_at'].to_representation(instance.created_at),
+            'updated_at': fields['updated_at'].to_representation(instance.updated_at),
+        }
+
 
 class CycleSerializer(serializers.ModelSerializer):
     """Serializer for Cycle model."""
@@ -67,18 +99,21 @@ class CycleCreateSerializer(serializers.ModelSerializer):
         """Create a new cycle and mark previous cycles as inactive."""
         user = self.context['request'].user
 
-        # Mark all previous cycles as inactive
-        Cycle.objects.filter(user=user, is_active=True).update(is_active=False)
+        # Swap the active cycle atomically so there is always exactly one
+        with transaction.atomic():
+            # Mark all previous cycles as inactive
+            Cycle.objects.filter(user=user, is_active=True).update(is_active=False)
 
-        # Create new active cycle
-        cycle = Cycle.objects.create(user=user, is_active=True, **validated_data)
+            # Create new active cycle
+            cycle = Cycle.objects.create(user=user, is_active=True, **validated_data)
+        cache.delete(active_cycle_cache_key(user.pk))
         return cycle
 
 
 class DailyLogSerializer(serializers.ModelSerializer):
     """Serializer for DailyLog model."""
 
-    symptoms = SymptomSerializer(many=True, read_only=True)
+    symptoms = serializers.SerializerMethodField()
     symptom_ids = serializers.ListField(
         child=serializers.IntegerField(),
         write_only=True,
@@ -102,15 +137,34 @@ class DailyLogSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'symptoms', 'created_at', 'updated_at']
 
+    @extend_schema_field(NestedSymptomSerializer(many=True))
+    def get_symptoms(self, obj):
+        """Render symptoms straight from the (prefetched) related objects."""
+        return [
+            {'id': symptom.id, 'name': symptom.name, 'category': symptom.category}
+            for symptom in obj.symptoms.all()
+        ]
+
+    @staticmethod
+    def _link_symptoms(daily_log, symptom_ids):
+        """Insert the through rows for the active symptoms among symptom_ids in one statement."""
+        valid_ids = Symptom.objects.filter(id__in=symptom_ids, is_active=True).values_list('id', flat=True)
+        through = DailyLog.symptoms.through
+        through.objects.bulk_create(
+            [through(dailylog_id=daily_log.id, symptom_id=symptom_id) for symptom_id in valid_ids],
+            ignore_conflicts=True,
+        )
+
     def create(self, validated_data):
         """Create daily log with symptoms."""
         symptom_ids = validated_data.pop('symptom_ids', [])
         user = self.context['request'].user
 
-        daily_log = DailyLog.objects.create(user=user, **validated_data)
+        with transaction.atomic():
+            daily_log = DailyLog.objects.create(user=user, **validated_data)
 
-        if symptom_ids:
-            daily_log.symptoms.set(symptom_ids)
+            if symptom_ids:
+                self._link_symptoms(daily_log, symptom_ids)
 
         return daily_log
 
@@ -120,9 +174,13 @@ class DailyLogSerializer(serializers.ModelSerializer):
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
 
-        if symptom_ids is not None:
-            instance.symptoms.set(symptom_ids)
+        with transaction.atomic():
+            instance.save()
+
+            if symptom_ids is not None:
+                DailyLog.symptoms.through.objects.filter(dailylog_id=instance.id).delete()
+                if symptom_ids:
+                    self._link_symptoms(instance, symptom_ids)
 
         return instance
@@ -0,0 +1,16 @@
+"""
+Signal handlers for the Cycles module.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Symptom, SYMPTOMS_CACHE_KEY
+
+
+@receiver(post_save, sender=Symptom)
+@receiver(post_delete, sender=Symptom)
+def invalidate_symptom_cache(sender, **kwargs):
+    """Drop the cached symptom catalogue whenever a symptom changes."""
+    cache.delete(SYMPTOMS_CACHE_KEY)
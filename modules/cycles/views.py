@@ -9,8 +9,20 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from drf_spectacular.utils import extend_schema
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 
-from .models import Cycle, PeriodDay, Symptom, DailyLog
+from .models import (
+    Cycle,
+    PeriodDay,
+    Symptom,
+    DailyLog,
+    ACTIVE_CYCLE_CACHE_TIMEOUT,
+    SYMPTOMS_CACHE_KEY,
+    SYMPTOMS_CACHE_TIMEOUT,
+    active_cycle_cache_key,
+)
 from .serializers import (
     CycleSerializer,
     CycleCreateSerializer,
@@ -20,6 +32,7 @@ from .serializers import (
 )
 from shared.utils import format_response
 from shared.exceptions import NotFoundException
+from shared.renderers import ORJSONRenderer
 
 
 class CycleViewSet(viewsets.ModelViewSet):
@@ -34,6 +47,7 @@ class CycleViewSet(viewsets.ModelViewSet):
     filterset_fields = ['is_active', 'start_date']
     ordering_fields = ['start_date', 'created_at']
     ordering = ['-start_date']
+    summary_fields = ['id', 'start_date', 'end_date', 'cycle_length', 'period_length', 'is_active']
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -43,12 +57,25 @@ class CycleViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return cycles for the current user only."""
-        return Cycle.objects.filter(user=self.request.user).prefetch_related('period_days')
+        return Cycle.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch(
+                'period_days',
+                queryset=PeriodDay.objects.only(
+                    'id', 'date', 'flow', 'notes', 'cycle_id', 'created_at', 'updated_at'
+                ).order_by('date'),
+            )
+        ).seal()
 
     @extend_schema(tags=['Cycles'])
     def list(self, request, *args, **kwargs):
         """List all cycles for the current user."""
         queryset = self.filter_queryset(self.get_queryset())
+        if request.query_params.get('fields') == 'summary':
+            # Dashboards only need the headline columns; skip the prefetch and serializer
+            return Response(
+                format_response(list(queryset.values(*self.summary_fields))),
+                status=status.HTTP_200_OK
+            )
         serializer = self.get_serializer(queryset, many=True)
         return Response(format_response(serializer.data), status=status.HTTP_200_OK)
 
@@ -82,10 +109,12 @@ class CycleViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         cycle = serializer.save()
 
-        # Recalculate cycle length if end date was updated
-        if 'end_date' in request.data:
-            cycle.calculate_cycle_length()
-            cycle.save()
+        # cycle_length is generated by the database; reload it when the dates change
+        if {'start_date', 'end_date'} & serializer.validated_data.keys():
+            cycle.refresh_from_db(fields=['cycle_length'])
+
+        if 'is_active' in serializer.validated_data:
+            cache.delete(active_cycle_cache_key(request.user.pk))
 
         return Response(
             format_response(
@@ -95,6 +124,11 @@ class CycleViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
+    def perform_destroy(self, instance):
+        """Delete the cycle and forget the cached active cycle id."""
+        instance.delete()
+        cache.delete(active_cycle_cache_key(self.request.user.pk))
+
     @extend_schema(tags=['Cycles'])
     @action(detail=True, methods=['post'])
     def add_period_day(self, request, pk=None):
@@ -113,19 +147,49 @@ class CycleViewSet(viewsets.ModelViewSet):
             )
         return Response({'success': False, 'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(tags=['Cycles'], request=PeriodDaySerializer(many=True))
+    @action(detail=True, methods=['post'], url_path='period-days/bulk')
+    def add_period_days_bulk(self, request, pk=None):
+        """Add several period days to a cycle in a single INSERT; dates already logged are skipped."""
+        cycle = self.get_object()
+        serializer = PeriodDaySerializer(data=request.data, many=True)
+
+        if serializer.is_valid():
+            PeriodDay.objects.bulk_create(
+                [PeriodDay(cycle=cycle, **period_day) for period_day in serializer.validated_data],
+                ignore_conflicts=True,
+                batch_size=500,
+            )
+            return Response(
+                format_response(
+                    PeriodDaySerializer(PeriodDay.objects.filter(cycle=cycle).order_by('date'), many=True).data,
+                    message="Period days added successfully"
+                ),
+                status=status.HTTP_201_CREATED
+            )
+        return Response({'success': False, 'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
     @extend_schema(tags=['Cycles'])
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get the current active cycle."""
-        try:
-            cycle = Cycle.objects.get(user=request.user, is_active=True)
-            serializer = self.get_serializer(cycle)
-            return Response(format_response(serializer.data), status=status.HTTP_200_OK)
-        except Cycle.DoesNotExist:
-            return Response(
-                {'success': False, 'message': 'No active cycle found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        queryset = self.get_queryset().filter(is_active=True)
+        cache_key = active_cycle_cache_key(request.user.pk)
+        cycle_id = cache.get(cache_key)
+
+        # Look up by primary key when the active cycle id is cached
+        cycle = queryset.filter(pk=cycle_id).first() if cycle_id is not None else None
+        if cycle is None:
+            cycle = queryset.order_by('-start_date').first()
+            if cycle is None:
+                return Response(
+                    {'success': False, 'message': 'No active cycle found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            cache.set(cache_key, cycle.pk, ACTIVE_CYCLE_CACHE_TIMEOUT)
+
+        serializer = self.get_serializer(cycle)
+        return Response(format_response(serializer.data), status=status.HTTP_200_OK)
 
 
 class DailyLogViewSet(viewsets.ModelViewSet):
@@ -141,10 +205,17 @@ class DailyLogViewSet(viewsets.ModelViewSet):
     filterset_fields = ['date', 'mood']
     ordering_fields = ['date', 'created_at']
     ordering = ['-date']
+    export_chunk_size = 200
 
     def get_queryset(self):
         """Return daily logs for the current user only."""
-        return DailyLog.objects.filter(user=self.request.user).prefetch_related('symptoms')
+        queryset = DailyLog.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch('symptoms', queryset=Symptom.objects.only('id', 'name', 'category'))
+        )
+        # Updates re-read symptoms after DRF drops the prefetch cache, so only seal reads
+        if self.action in ['list', 'retrieve', 'export']:
+            return queryset.seal()
+        return queryset
 
     @extend_schema(tags=['Daily Logs'])
     def list(self, request, *args, **kwargs):
@@ -153,6 +224,28 @@ class DailyLogViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(format_response(serializer.data), status=status.HTTP_200_OK)
 
+    @extend_schema(tags=['Daily Logs'], responses=DailyLogSerializer(many=True))
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream every daily log for the current user as a JSON array.
+
+        Rows are fetched in chunks so memory stays flat however long the history is.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        # Encode rows with the same renderer as every other API response
+        renderer = ORJSONRenderer()
+
+        def stream():
+            yield b'['
+            for index, daily_log in enumerate(queryset.iterator(chunk_size=self.export_chunk_size)):
+                if index:
+                    yield b','
+                yield renderer.render(DailyLogSerializer(daily_log).data)
+            yield b']'
+
+        return StreamingHttpResponse(stream(), content_type='application/json')
+
     @extend_schema(tags=['Daily Logs'])
     def create(self, request, *args, **kwargs):
         """Create a new daily log."""
@@ -175,6 +268,8 @@ def list_symptoms(request):
     """
     List all available symptoms for tracking.
     """
-    symptoms = Symptom.objects.filter(is_active=True)
-    serializer = SymptomSerializer(symptoms, many=True)
-    return Response(format_response(serializer.data), status=status.HTTP_200_OK)
+    data = cache.get(SYMPTOMS_CACHE_KEY)
+    if data is None:
+        data = SymptomSerializer(Symptom.objects.filter(is_active=True), many=True).data
+        cache.set(SYMPTOMS_CACHE_KEY, data, SYMPTOMS_CACHE_TIMEOUT)
+    return Response(format_response(data), status=status.HTTP_200_OK)
@@ -4,6 +4,7 @@ Admin interface configuration for the Notifications module.
 
 from django.contrib import admin
 from .models import NotificationTemplate, Notification, ReminderSchedule, NotificationPreference
+from shared.admin import LargeTablePaginator
 
 
 @admin.register(NotificationTemplate)
@@ -32,6 +33,9 @@ class NotificationAdmin(admin.ModelAdmin):
     list_filter = ['status', 'channel', 'is_read', 'scheduled_for']
     search_fields = ['user__email', 'subject', 'body']
     readonly_fields = ['created_at', 'updated_at', 'sent_at', 'read_at']
+    list_select_related = ['user']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
 
     fieldsets = (
         ('User', {'fields': ('user', 'template')}),
@@ -58,6 +62,7 @@ class ReminderScheduleAdmin(admin.ModelAdmin):
     list_filter = ['reminder_type', 'is_enabled', 'notification_channel']
     search_fields = ['user__email']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
 
 
 @admin.register(NotificationPreference)
@@ -79,6 +84,7 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
     ]
     search_fields = ['user__email']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
 
     fieldsets = (
         ('User', {'fields': ('user',)}),
@@ -14,4 +14,4 @@ class NotificationsConfig(AppConfig):
 
     def ready(self):
         """Import signal handlers when the app is ready."""
-        pass
+        import modules.notifications.signals
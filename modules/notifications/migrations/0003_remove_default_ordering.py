@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='notification',
+            options={'verbose_name': 'Notification', 'verbose_name_plural': 'Notifications'},
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_search_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'status', '-scheduled_for'], name='notif_user_status_sched'),
+        ),
+    ]
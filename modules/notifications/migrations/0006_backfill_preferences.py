@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:31
+
+from django.conf import settings
+from django.db import migrations
+
+
+def create_missing_preferences(apps, schema_editor):
+    """Give every existing user a preference row now that views read it without get_or_create."""
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    NotificationPreference = apps.get_model('notifications', 'NotificationPreference')
+    NotificationPreference.objects.bulk_create(
+        [
+            NotificationPreference(user_id=user_id)
+            for user_id in User.objects.filter(notification_preferences__isnull=True).values_list('id', flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_notif_user_status_sched'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing_preferences, migrations.RunPython.noop),
+    ]
@@ -2,9 +2,19 @@
 Models for notifications and reminders.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 
+# Serialized notification preferences are cached until the preference row is written
+NOTIFICATION_PREFERENCES_CACHE_TIMEOUT = 60 * 5
+
+
+def notification_preferences_cache_key(user_id) -> str:
+    """Cache key for a user's serialized notification preferences."""
+    return f'notifpref:{user_id}'
+
 
 class NotificationTemplate(models.Model):
     """
@@ -95,11 +105,14 @@ class Notification(models.Model):
         db_table = 'notifications'
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
-        ordering = ['-scheduled_for']
         indexes = [
             models.Index(fields=['user', '-scheduled_for']),
             models.Index(fields=['status', 'scheduled_for']),
             models.Index(fields=['user', 'is_read']),
+            models.Index(fields=['user', 'status', '-scheduled_for'], name='notif_user_status_sched'),
+            # Trigram indexes for the admin's icontains search, which filters on UPPER(column)
+            GinIndex(OpClass(Upper('subject'), name='gin_trgm_ops'), name='notif_subject_trgm'),
+            GinIndex(OpClass(Upper('body'), name='gin_trgm_ops'), name='notif_body_trgm'),
         ]
 
     def __str__(self):
@@ -2,6 +2,7 @@
 Serializers for the Notifications module.
 """
 
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 from .models import Notification, ReminderSchedule, NotificationPreference, NotificationTemplate
 
@@ -14,6 +15,16 @@ class NotificationTemplateSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'notification_type', 'subject', 'is_active']
 
 
+class NotificationListSerializer(serializers.ListSerializer):
+    """List serializer that loads the notifications' templates in one batch."""
+
+    def to_representation(self, data):
+        """Fetch any templates not already joined with a single query before rendering."""
+        notifications = list(data.all() if hasattr(data, 'all') else data)
+        prefetch_related_objects(notifications, 'template')
+        return super().to_representation(notifications)
+
+
 class NotificationSerializer(serializers.ModelSerializer):
     """Serializer for notifications."""
 
@@ -35,6 +46,27 @@ class NotificationSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = fields
+        list_serializer_class = NotificationListSerializer
+
+    def to_representation(self, instance):
+        """Build the read-only payload directly; only timestamps go through their fields."""
+        fields = self.fields
+        data = {
+            'id': instance.id,
+            'subject': instance.subject,
+            'body': instance.body,
+            'channel': instance.channel,
+            'status': instance.status,
+            'scheduled_for': fields['scheduled_for'].to_representation(instance.scheduled_for),
+            'sent_at': fields['sent_at'].to_representation(instance.sent_at),
+            'is_read': instance.is_read,
+            'read_at': fields['read_at'].to_representation(instance.read_at),
+        }
+        # Like the declared field, template_name is left out when there is no template
+        if instance.template is not None:
+            data['template_name'] = instance.template.name
+        data['created_at'] = fields['created_at'].to_representation(instance.created_at)
+        return data
 
 
 class ReminderScheduleSerializer(serializers.ModelSerializer):
@@ -75,3 +107,10 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['updated_at']
+
+    def update(self, instance, validated_data):
+        """Write back only the submitted preferences instead of the whole row."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
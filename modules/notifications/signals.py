@@ -0,0 +1,16 @@
+"""
+Signal handlers for the Notifications module.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import NotificationPreference, notification_preferences_cache_key
+
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def invalidate_notification_preferences_cache(sender, instance, **kwargs):
+    """Drop a user's cached preferences whenever their preference row changes."""
+    cache.delete(notification_preferences_cache_key(instance.user_id))
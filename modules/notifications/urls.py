@@ -8,21 +8,15 @@ from . import views
 
 app_name = 'notifications'
 
-# Create separate routers to avoid URL conflicts
-notification_router = DefaultRouter()
-notification_router.register(r'', views.NotificationViewSet, basename='notification')
-
-reminder_router = DefaultRouter()
-reminder_router.register(r'', views.ReminderScheduleViewSet, basename='reminder')
+router = DefaultRouter()
+# Reminders are registered first so their prefix wins over the notification detail route
+router.register(r'reminders', views.ReminderScheduleViewSet, basename='reminder')
+router.register(r'', views.NotificationViewSet, basename='notification')
 
 urlpatterns = [
     # Preferences endpoints
     path('preferences/', views.get_notification_preferences, name='preferences'),
     path('preferences/update/', views.update_notification_preferences, name='update_preferences'),
 
-    # Reminders endpoints (separate path to avoid conflict)
-    path('reminders/', include(reminder_router.urls)),
-
-    # Notification endpoints at root
-    path('', include(notification_router.urls)),
+    path('', include(router.urls)),
 ]
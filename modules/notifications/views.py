@@ -9,9 +9,16 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from drf_spectacular.utils import extend_schema
+from django.core.cache import cache
 from django.utils import timezone
 
-from .models import Notification, ReminderSchedule, NotificationPreference
+from .models import (
+    Notification,
+    ReminderSchedule,
+    NotificationPreference,
+    NOTIFICATION_PREFERENCES_CACHE_TIMEOUT,
+    notification_preferences_cache_key,
+)
 from .serializers import (
     NotificationSerializer,
     ReminderScheduleSerializer,
@@ -20,6 +27,20 @@ from .serializers import (
 from shared.utils import format_response
 
 
+def _get_notification_preferences(user):
+    """
+    Return the user's notification preferences.
+
+    The row is normally created with the user, but users inserted without
+    post_save (fixtures, bulk inserts) may lack one; create it on demand.
+    """
+    try:
+        return NotificationPreference.objects.get(user=user)
+    except NotificationPreference.DoesNotExist:
+        preferences, _ = NotificationPreference.objects.get_or_create(user=user)
+        return preferences
+
+
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing notifications.
@@ -36,19 +57,28 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         """Return notifications for the current user only."""
-        return Notification.objects.filter(user=self.request.user)
+        queryset = Notification.objects.filter(user=self.request.user).select_related('template')
+        if self.action in ['list', 'retrieve', 'mark_as_read']:
+            # Load just the serialized columns
+            return queryset.only(
+                'id', 'subject', 'body', 'channel', 'status', 'scheduled_for', 'sent_at',
+                'is_read', 'read_at', 'created_at', 'template__name',
+            )
+        return queryset
 
     @extend_schema(tags=['Notifications'])
     def list(self, request, *args, **kwargs):
         """List all notifications for the current user."""
         queryset = self.filter_queryset(self.get_queryset())
-        unread_count = queryset.filter(is_read=False).count()
 
         serializer = self.get_serializer(queryset, many=True)
+        notifications = serializer.data
+
+        # The list is unpaginated, so the unread count falls out of the fetched rows
         return Response(
             format_response({
-                'notifications': serializer.data,
-                'unread_count': unread_count,
+                'notifications': notifications,
+                'unread_count': sum(1 for notification in notifications if not notification['is_read']),
             }),
             status=status.HTTP_200_OK
         )
@@ -67,7 +97,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         notification = self.get_object()
         notification.is_read = True
         notification.read_at = timezone.now()
-        notification.save()
+        notification.save(update_fields=['is_read', 'read_at', 'updated_at'])
 
         serializer = self.get_serializer(notification)
         return Response(
@@ -117,11 +147,11 @@ class ReminderScheduleViewSet(viewsets.ModelViewSet):
         """Create a new reminder schedule."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        reminder = serializer.save(user=request.user)
+        serializer.save(user=request.user)
 
         return Response(
             format_response(
-                ReminderScheduleSerializer(reminder).data,
+                serializer.data,
                 message="Reminder schedule created successfully"
             ),
             status=status.HTTP_201_CREATED
@@ -134,11 +164,11 @@ class ReminderScheduleViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        reminder = serializer.save()
+        serializer.save()
 
         return Response(
             format_response(
-                ReminderScheduleSerializer(reminder).data,
+                serializer.data,
                 message="Reminder schedule updated successfully"
             ),
             status=status.HTTP_200_OK
@@ -162,9 +192,13 @@ def get_notification_preferences(request):
     """
     Get notification preferences for the current user.
     """
-    preferences, created = NotificationPreference.objects.get_or_create(user=request.user)
-    serializer = NotificationPreferenceSerializer(preferences)
-    return Response(format_response(serializer.data), status=status.HTTP_200_OK)
+    cache_key = notification_preferences_cache_key(request.user.pk)
+    data = cache.get(cache_key)
+    if data is None:
+        preferences = _get_notification_preferences(request.user)
+        data = NotificationPreferenceSerializer(preferences).data
+        cache.set(cache_key, data, NOTIFICATION_PREFERENCES_CACHE_TIMEOUT)
+    return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=['Notification Preferences'])
@@ -174,7 +208,7 @@ def update_notification_preferences(request):
     """
     Update notification preferences for the current user.
     """
-    preferences, created = NotificationPreference.objects.get_or_create(user=request.user)
+    preferences = _get_notification_preferences(request.user)
     partial = request.method == 'PATCH'
     serializer = NotificationPreferenceSerializer(preferences, data=request.data, partial=partial)
 
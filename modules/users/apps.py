@@ -17,5 +17,4 @@ class UsersConfig(AppConfig):
         Import signal handlers when the app is ready.
         """
         # Import signals here to avoid circular imports
-        # import modules.users.signals
-        pass
+        import modules.users.signals
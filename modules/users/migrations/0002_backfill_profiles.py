@@ -0,0 +1,24 @@
+# Generated by Django 5.0.2 on 2026-10-15 22:31
+
+from django.db import migrations
+
+
+def create_missing_profiles(apps, schema_editor):
+    """Give every existing user a profile now that views read it without get_or_create."""
+    User = apps.get_model('users', 'User')
+    UserProfile = apps.get_model('users', 'UserProfile')
+    UserProfile.objects.bulk_create(
+        [UserProfile(user_id=user_id) for user_id in User.objects.filter(profile__isnull=True).values_list('id', flat=True)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing_profiles, migrations.RunPython.noop),
+    ]
@@ -41,7 +41,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     Uses email as the unique identifier instead of username.
     """
 
-    email = models.EmailField(unique=True, db_index=True)
+    email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=150, blank=True)
     last_name = models.CharField(max_length=150, blank=True)
 
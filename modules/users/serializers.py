@@ -4,6 +4,7 @@ Serializers for the Users module.
 
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.db import transaction
 from .models import User, UserProfile
 
 
@@ -41,6 +42,27 @@ class UserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'date_joined']
 
+    def to_representation(self, instance):
+        """Build the payload directly; it is rendered on every login, registration and /me call."""
+        fields = self.fields
+        # Users loaded from fixtures (raw saves) may have no profile
+        profile = getattr(instance, 'profile', None)
+        return {
+            'id': instance.id,
+            'email': instance.email,
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'date_of_birth': fields['date_of_birth'].to_representation(instance.date_of_birth),
+            'timezone': instance.timezone,
+            'date_joined': fields['date_joined'].to_representation(instance.date_joined),
+            'profile': fields['profile'].to_representation(profile) if profile is not None else None,
+        }
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the nested profile so serializing users does not query it per row."""
+        return queryset.select_related('profile')
+
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
@@ -69,12 +91,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """Create a new user with encrypted password."""
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
-        user = User.objects.create_user(password=password, **validated_data)
-
-        # Create associated profile
-        UserProfile.objects.create(user=user)
-
-        return user
+        # The profile and notification preferences are created by a post_save signal;
+        # commit them together with the user so a failure cannot leave a half-created account
+        with transaction.atomic():
+            return User.objects.create_user(password=password, **validated_data)
 
 
 class UserLoginSerializer(serializers.Serializer):
@@ -125,5 +145,5 @@ class PasswordChangeSerializer(serializers.Serializer):
         """Update the user's password."""
         user = self.context['request'].user
         user.set_password(self.validated_data['new_password'])
-        user.save()
+        user.save(update_fields=['password'])
         return user
@@ -0,0 +1,17 @@
+"""
+Signal handlers for the Users module.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import User, UserProfile
+from modules.notifications.models import NotificationPreference
+
+
+@receiver(post_save, sender=User)
+def create_user_settings(sender, instance, created, raw=False, **kwargs):
+    """Create the profile and notification preferences that every user is expected to have."""
+    if created and not raw:
+        UserProfile.objects.create(user=instance)
+        NotificationPreference.objects.create(user=instance)
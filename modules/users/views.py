@@ -109,7 +109,8 @@ def get_current_user(request):
     """
     Get the current authenticated user's profile.
     """
-    serializer = UserSerializer(request.user)
+    user = UserSerializer.setup_eager_loading(User.objects.all()).get(pk=request.user.pk)
+    serializer = UserSerializer(user)
     return Response(format_response(serializer.data), status=status.HTTP_200_OK)
 
 
@@ -0,0 +1,32 @@
+"""
+Serializers for the Visualizations module.
+
+These validate chart query parameters; the chart payloads themselves are plain dicts.
+"""
+
+from rest_framework import serializers
+
+
+class CycleHistoryParamsSerializer(serializers.Serializer):
+    """Query parameters for the cycle length history chart."""
+
+    months = serializers.IntegerField(default=6, min_value=1, max_value=60, help_text='Number of months of history')
+
+
+class CycleCalendarParamsSerializer(serializers.Serializer):
+    """Query parameters for the cycle calendar."""
+
+    year = serializers.IntegerField(min_value=1970, max_value=2100, help_text='Year')
+    month = serializers.IntegerField(min_value=1, max_value=12, help_text='Month (1-12)')
+
+
+class DaysParamsSerializer(serializers.Serializer):
+    """Query parameters for charts covering the last ``days`` days."""
+
+    days = serializers.IntegerField(default=90, min_value=1, max_value=730, help_text='Number of days to analyze')
+
+
+class MoodTimelineParamsSerializer(DaysParamsSerializer):
+    """Query parameters for the mood timeline, which defaults to the last 30 days."""
+
+    days = serializers.IntegerField(default=30, min_value=1, max_value=730, help_text='Number of days to analyze')
@@ -2,13 +2,46 @@
 Services for aggregating data for visualizations.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from django.db.models import Avg, Count, Q
-from collections import defaultdict
+from datetime import date, timedelta
+from typing import Callable, List, Dict, Any
+from uuid import uuid4
+from django.core.cache import cache
+from django.db.models import Avg, Case, CharField, Count, F, Func, IntegerField, Q, Value, When
+from django.db.models.functions import Abs
 
 from modules.cycles.models import Cycle, DailyLog
 from modules.analytics.models import CycleStatistics
+from modules.analytics.services import StatisticsService
+
+# Chart data is cached per user until one of their cycles or daily logs changes;
+# the timeout bounds how stale the date-relative windows ("last N days") can get
+VISUALIZATION_CACHE_TIMEOUT = 60 * 5
+
+# Rows fetched per round trip when walking timeline querysets
+TIMELINE_CHUNK_SIZE = 1000
+
+
+def _data_version_cache_key(user_id) -> str:
+    """Cache key for the token that versions a user's cached chart data."""
+    return f'viz:version:{user_id}'
+
+
+def invalidate_visualizations(user_id) -> None:
+    """Orphan every cached chart for the user; the old entries simply expire."""
+    cache.delete(_data_version_cache_key(user_id))
+
+
+def cached_visualization(user_id, name: str, params: tuple, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the cached chart data for ``name``/``params``, computing and storing it on a miss.
+    """
+    version = cache.get_or_set(_data_version_cache_key(user_id), lambda: uuid4().hex, None)
+    cache_key = ':'.join(['viz', str(user_id), version, name, *map(str, params)])
+    data = cache.get(cache_key)
+    if data is None:
+        data = compute()
+        cache.set(cache_key, data, VISUALIZATION_CACHE_TIMEOUT)
+    return data
 
 
 class CycleVisualizationService:
@@ -25,12 +58,12 @@ class CycleVisualizationService:
 
         Returns data suitable for a line chart showing cycle length over time.
         """
-        cutoff_date = datetime.now().date() - timedelta(days=months * 30)
+        cutoff_date = date.today() - timedelta(days=months * 30)
         cycles = Cycle.objects.filter(
             user=self.user,
             start_date__gte=cutoff_date,
             cycle_length__isnull=False
-        ).order_by('start_date')
+        ).order_by('start_date').values_list('start_date', 'cycle_length')
 
         data = {
             'labels': [],
@@ -40,9 +73,9 @@ class CycleVisualizationService:
             }]
         }
 
-        for cycle in cycles:
-            data['labels'].append(cycle.start_date.strftime('%Y-%m-%d'))
-            data['datasets'][0]['data'].append(cycle.cycle_length)
+        for start_date, cycle_length in cycles.iterator(chunk_size=TIMELINE_CHUNK_SIZE):
+            data['labels'].append(start_date.isoformat())
+            data['datasets'][0]['data'].append(cycle_length)
 
         return data
 
@@ -53,11 +86,11 @@ class CycleVisualizationService:
         Returns:
             Dictionary with dates and their cycle phases
         """
-        start_date = datetime(year, month, 1).date()
+        start_date = date(year, month, 1)
         if month == 12:
-            end_date = datetime(year + 1, 1, 1).date()
+            end_date = date(year + 1, 1, 1)
         else:
-            end_date = datetime(year, month + 1, 1).date()
+            end_date = date(year, month + 1, 1)
 
         calendar_data = {}
 
@@ -67,38 +100,41 @@ class CycleVisualizationService:
             start_date__lte=end_date,
         ).filter(
             Q(end_date__gte=start_date) | Q(end_date__isnull=True)
-        )
-
-        for cycle in cycles:
-            # Mark period days
-            current_date = max(cycle.start_date, start_date)
-            cycle_end = cycle.end_date if cycle.end_date else end_date
-
-            while current_date < min(cycle_end, end_date):
-                if current_date >= start_date:
-                    # Determine phase
-                    days_into_cycle = (current_date - cycle.start_date).days + 1
-
-                    if cycle.period_length and days_into_cycle <= cycle.period_length:
-                        phase = 'period'
-                    elif cycle.cycle_length:
-                        # Estimate ovulation around day 14 before next cycle
-                        ovulation_day = cycle.cycle_length - 14
-                        if abs(days_into_cycle - ovulation_day) <= 1:
-                            phase = 'ovulation'
-                        elif ovulation_day - 3 <= days_into_cycle <= ovulation_day + 1:
-                            phase = 'fertile'
-                        else:
-                            phase = 'normal'
-                    else:
-                        phase = 'normal'
-
-                    calendar_data[current_date.strftime('%Y-%m-%d')] = {
-                        'phase': phase,
-                        'day_of_cycle': days_into_cycle,
-                    }
-
-                current_date += timedelta(days=1)
+        ).order_by('-start_date').values_list('start_date', 'end_date', 'period_length', 'cycle_length')
+
+        for cycle_start, cycle_end, period_length, cycle_length in cycles:
+            # Walk day offsets within the month rather than incrementing dates
+            first_offset = (max(cycle_start, start_date) - cycle_start).days
+            last_offset = (min(cycle_end or end_date, end_date) - cycle_start).days
+
+            # Phase boundaries in days into the cycle, worked out once per cycle
+            period_end = period_length or 0
+            if cycle_length:
+                # Estimate ovulation around day 14 before next cycle
+                ovulation_day = cycle_length - 14
+                ovulation_start, ovulation_end = ovulation_day - 1, ovulation_day + 1
+                fertile_start = ovulation_day - 3
+            else:
+                # Without a cycle length every day after the period is 'normal'
+                ovulation_start, ovulation_end = 0, -1
+                fertile_start = 0
+
+            for offset in range(first_offset, last_offset):
+                days_into_cycle = offset + 1
+
+                if days_into_cycle <= period_end:
+                    phase = 'period'
+                elif ovulation_start <= days_into_cycle <= ovulation_end:
+                    phase = 'ovulation'
+                elif fertile_start <= days_into_cycle < ovulation_start:
+                    phase = 'fertile'
+                else:
+                    phase = 'normal'
+
+                calendar_data[(cycle_start + timedelta(days=offset)).isoformat()] = {
+                    'phase': phase,
+                    'day_of_cycle': days_into_cycle,
+                }
 
         return calendar_data
 
@@ -108,38 +144,56 @@ class CycleVisualizationService:
 
         Returns data suitable for a bar chart or radar chart.
         """
-        try:
-            stats = CycleStatistics.objects.get(user=self.user)
-
-            data = {
-                'labels': [
-                    'Average Cycle Length',
-                    'Shortest Cycle',
-                    'Longest Cycle',
-                    'Average Period Length',
-                ],
-                'datasets': [{
-                    'label': 'Days',
-                    'data': [
-                        float(stats.average_cycle_length),
-                        stats.shortest_cycle_length,
-                        stats.longest_cycle_length,
-                        float(stats.average_period_length),
-                    ]
-                }],
-                'metadata': {
-                    'total_cycles': stats.total_cycles_tracked,
-                    'regularity_score': float(stats.cycle_regularity_score),
+        stats = CycleStatistics.objects.filter(user=self.user).values_list(
+            'average_cycle_length',
+            'shortest_cycle_length',
+            'longest_cycle_length',
+            'average_period_length',
+            'total_cycles_tracked',
+            'cycle_regularity_score',
+        ).first()
+        if stats is None:
+            # Nothing stored yet: compute the same figures from the cycles without saving them
+            computed = StatisticsService(self.user).compute_statistics()
+            if not computed.total_cycles_tracked:
+                return {
+                    'labels': [],
+                    'datasets': [],
+                    'metadata': {'error': 'No statistics available'}
                 }
-            }
+            stats = (
+                computed.average_cycle_length,
+                computed.shortest_cycle_length,
+                computed.longest_cycle_length,
+                computed.average_period_length,
+                computed.total_cycles_tracked,
+                computed.cycle_regularity_score,
+            )
+
+        (average_cycle_length, shortest_cycle_length, longest_cycle_length,
+         average_period_length, total_cycles_tracked, cycle_regularity_score) = stats
 
-            return data
-        except CycleStatistics.DoesNotExist:
-            return {
-                'labels': [],
-                'datasets': [],
-                'metadata': {'error': 'No statistics available'}
+        return {
+            'labels': [
+                'Average Cycle Length',
+                'Shortest Cycle',
+                'Longest Cycle',
+                'Average Period Length',
+            ],
+            'datasets': [{
+                'label': 'Days',
+                'data': [
+                    float(average_cycle_length),
+                    shortest_cycle_length,
+                    longest_cycle_length,
+                    float(average_period_length),
+                ]
+            }],
+            'metadata': {
+                'total_cycles': total_cycles_tracked,
+                'regularity_score': cycle_regularity_score / 100,
             }
+        }
 
 
 class SymptomVisualizationService:
@@ -156,28 +210,28 @@ class SymptomVisualizationService:
 
         Returns data suitable for a bar chart showing most common symptoms.
         """
-        cutoff_date = datetime.now().date() - timedelta(days=days)
-        logs = DailyLog.objects.filter(
-            user=self.user,
-            date__gte=cutoff_date
-        ).prefetch_related('symptoms')
+        cutoff_date = date.today() - timedelta(days=days)
 
-        symptom_counts = defaultdict(int)
-        for log in logs:
-            for symptom in log.symptoms.all():
-                symptom_counts[symptom.name] += 1
-
-        # Sort by frequency
-        sorted_symptoms = sorted(symptom_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Count in the database over the log/symptom link table; only the top ten rows come back
+        top_symptoms = DailyLog.symptoms.through.objects.filter(
+            dailylog__user=self.user,
+            dailylog__date__gte=cutoff_date
+        ).values_list('symptom__name').annotate(
+            count=Count('id')
+        ).order_by('-count', 'symptom__name')[:10]
 
         data = {
-            'labels': [s[0] for s in sorted_symptoms],
+            'labels': [],
             'datasets': [{
                 'label': 'Frequency',
-                'data': [s[1] for s in sorted_symptoms],
+                'data': [],
             }]
         }
 
+        for name, count in top_symptoms:
+            data['labels'].append(name)
+            data['datasets'][0]['data'].append(count)
+
         return data
 
     def get_symptom_by_cycle_phase(self) -> Dict[str, Any]:
@@ -190,39 +244,42 @@ class SymptomVisualizationService:
         cycles = Cycle.objects.filter(
             user=self.user,
             end_date__isnull=False
-        ).order_by('-start_date')[:3]
+        ).order_by('-start_date').values_list('id', 'cycle_length')[:3]
+        cycle_ids = [cycle_id for cycle_id, cycle_length in cycles if cycle_length]
 
         phase_symptoms = {
-            'period': defaultdict(int),
-            'follicular': defaultdict(int),
-            'ovulation': defaultdict(int),
-            'luteal': defaultdict(int),
+            'period': {},
+            'follicular': {},
+            'ovulation': {},
+            'luteal': {},
         }
 
-        for cycle in cycles:
-            if not cycle.cycle_length:
-                continue
-
-            logs = DailyLog.objects.filter(
-                user=self.user,
-                cycle=cycle
-            ).prefetch_related('symptoms')
-
-            for log in logs:
-                days_into_cycle = (log.date - cycle.start_date).days + 1
-
-                # Determine phase
-                if cycle.period_length and days_into_cycle <= cycle.period_length:
-                    phase = 'period'
-                elif days_into_cycle <= cycle.cycle_length // 2:
-                    phase = 'follicular'
-                elif abs(days_into_cycle - (cycle.cycle_length - 14)) <= 2:
-                    phase = 'ovulation'
-                else:
-                    phase = 'luteal'
-
-                for symptom in log.symptoms.all():
-                    phase_symptoms[phase][symptom.name] += 1
+        # Classify each log/symptom link by phase and count them in a single grouped query
+        cycle_length = F('dailylog__cycle__cycle_length')
+        period_length = F('dailylog__cycle__period_length')
+        counts = DailyLog.symptoms.through.objects.filter(
+            dailylog__user=self.user,
+            dailylog__cycle_id__in=cycle_ids
+        ).annotate(
+            days_into_cycle=Func(
+                F('dailylog__date'), F('dailylog__cycle__start_date'),
+                template='(%(expressions)s)', arg_joiner=' - ', output_field=IntegerField()
+            ) + Value(1),
+        ).annotate(
+            ovulation_distance=Abs(F('days_into_cycle') - (cycle_length - Value(14))),
+            phase=Case(
+                When(Q(dailylog__cycle__period_length__gt=0, days_into_cycle__lte=period_length), then=Value('period')),
+                When(days_into_cycle__lte=cycle_length / Value(2), then=Value('follicular')),
+                When(ovulation_distance__lte=2, then=Value('ovulation')),
+                default=Value('luteal'),
+                output_field=CharField(),
+            ),
+        ).values_list('phase', 'symptom__name').annotate(
+            count=Count('id')
+        ).order_by('-count', 'symptom__name')
+
+        for phase, name, count in counts:
+            phase_symptoms[phase][name] = count
 
         return {
             'phases': list(phase_symptoms.keys()),
@@ -230,6 +287,19 @@ class SymptomVisualizationService:
         }
 
 
+# Mood scores plotted on the mood timeline
+MOOD_VALUES = {
+    'great': 5,
+    'good': 4,
+    'okay': 3,
+    'bad': 2,
+    'terrible': 1,
+}
+
+# Display labels for the mood distribution chart
+MOOD_LABELS = dict(DailyLog.MOOD_CHOICES)
+
+
 class MoodVisualizationService:
     """
     Service for generating mood-related visualization data.
@@ -242,20 +312,19 @@ class MoodVisualizationService:
         """
         Get mood data over time for timeline visualization.
         """
-        cutoff_date = datetime.now().date() - timedelta(days=days)
+        cutoff_date = date.today() - timedelta(days=days)
+        # Map moods to scores in SQL so only (date, score) tuples come back
         logs = DailyLog.objects.filter(
             user=self.user,
             date__gte=cutoff_date,
             mood__isnull=False
-        ).order_by('date')
-
-        mood_values = {
-            'great': 5,
-            'good': 4,
-            'okay': 3,
-            'bad': 2,
-            'terrible': 1,
-        }
+        ).order_by('date').annotate(
+            score=Case(
+                *[When(mood=mood, then=Value(score)) for mood, score in MOOD_VALUES.items()],
+                default=Value(3),
+                output_field=IntegerField(),
+            )
+        ).values_list('date', 'score')
 
         data = {
             'labels': [],
@@ -265,9 +334,9 @@ class MoodVisualizationService:
             }]
         }
 
-        for log in logs:
-            data['labels'].append(log.date.strftime('%Y-%m-%d'))
-            data['datasets'][0]['data'].append(mood_values.get(log.mood, 3))
+        for log_date, score in logs.iterator(chunk_size=TIMELINE_CHUNK_SIZE):
+            data['labels'].append(log_date.isoformat())
+            data['datasets'][0]['data'].append(score)
 
         return data
 
@@ -275,12 +344,12 @@ class MoodVisualizationService:
         """
         Get mood distribution as percentages for pie/doughnut chart.
         """
-        cutoff_date = datetime.now().date() - timedelta(days=days)
+        cutoff_date = date.today() - timedelta(days=days)
         mood_counts = DailyLog.objects.filter(
             user=self.user,
             date__gte=cutoff_date,
             mood__isnull=False
-        ).values('mood').annotate(count=Count('mood'))
+        ).values_list('mood').annotate(count=Count('mood'))
 
         data = {
             'labels': [],
@@ -290,8 +359,8 @@ class MoodVisualizationService:
             }]
         }
 
-        for item in mood_counts:
-            data['labels'].append(item['mood'].capitalize())
-            data['datasets'][0]['data'].append(item['count'])
+        for mood, count in mood_counts:
+            data['labels'].append(MOOD_LABELS.get(mood) or mood.capitalize())
+            data['datasets'][0]['data'].append(count)
 
         return data
@@ -0,0 +1,19 @@
+"""
+Signal handlers for the Visualizations module.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from modules.cycles.models import Cycle, DailyLog
+from .services import invalidate_visualizations
+
+
+@receiver(post_save, sender=Cycle)
+@receiver(post_delete, sender=Cycle)
+@receiver(post_save, sender=DailyLog)
+@receiver(post_delete, sender=DailyLog)
+def invalidate_visualization_cache(sender, instance, **kwargs):
+    """Drop the user's cached charts once the write (including any symptom links) commits."""
+    transaction.on_commit(lambda: invalidate_visualizations(instance.user_id))
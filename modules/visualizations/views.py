@@ -6,21 +6,26 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.utils import extend_schema
 
 from .services import (
     CycleVisualizationService,
     SymptomVisualizationService,
     MoodVisualizationService,
+    cached_visualization,
+)
+from .serializers import (
+    CycleHistoryParamsSerializer,
+    CycleCalendarParamsSerializer,
+    DaysParamsSerializer,
+    MoodTimelineParamsSerializer,
 )
 from shared.utils import format_response
 
 
 @extend_schema(
     tags=['Visualizations - Cycles'],
-    parameters=[
-        OpenApiParameter(name='months', description='Number of months of history', required=False, type=int)
-    ]
+    parameters=[CycleHistoryParamsSerializer]
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -31,19 +36,21 @@ def cycle_length_history(request):
     Query Parameters:
         - months: Number of months to include (default: 6)
     """
-    months = int(request.query_params.get('months', 6))
+    params = CycleHistoryParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    months = params.validated_data['months']
     service = CycleVisualizationService(request.user)
-    data = service.get_cycle_length_history(months)
+    data = cached_visualization(
+        request.user.pk, 'cycle_length_history', (months,),
+        lambda: service.get_cycle_length_history(months)
+    )
 
     return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(
     tags=['Visualizations - Cycles'],
-    parameters=[
-        OpenApiParameter(name='year', description='Year', required=True, type=int),
-        OpenApiParameter(name='month', description='Month (1-12)', required=True, type=int)
-    ]
+    parameters=[CycleCalendarParamsSerializer]
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -55,17 +62,16 @@ def cycle_calendar(request):
         - year: Year (e.g., 2024)
         - month: Month (1-12)
     """
-    year = int(request.query_params.get('year'))
-    month = int(request.query_params.get('month'))
-
-    if not (1 <= month <= 12):
-        return Response(
-            {'success': False, 'message': 'Month must be between 1 and 12'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+    params = CycleCalendarParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    year = params.validated_data['year']
+    month = params.validated_data['month']
 
     service = CycleVisualizationService(request.user)
-    data = service.get_cycle_calendar_data(year, month)
+    data = cached_visualization(
+        request.user.pk, 'cycle_calendar', (year, month),
+        lambda: service.get_cycle_calendar_data(year, month)
+    )
 
     return Response(format_response(data), status=status.HTTP_200_OK)
 
@@ -85,9 +91,7 @@ def cycle_statistics_chart(request):
 
 @extend_schema(
     tags=['Visualizations - Symptoms'],
-    parameters=[
-        OpenApiParameter(name='days', description='Number of days to analyze', required=False, type=int)
-    ]
+    parameters=[DaysParamsSerializer]
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -98,9 +102,14 @@ def symptom_frequency(request):
     Query Parameters:
         - days: Number of days to include (default: 90)
     """
-    days = int(request.query_params.get('days', 90))
+    params = DaysParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    days = params.validated_data['days']
     service = SymptomVisualizationService(request.user)
-    data = service.get_symptom_frequency(days)
+    data = cached_visualization(
+        request.user.pk, 'symptom_frequency', (days,),
+        lambda: service.get_symptom_frequency(days)
+    )
 
     return Response(format_response(data), status=status.HTTP_200_OK)
 
@@ -113,16 +122,14 @@ def symptom_by_phase(request):
     Get symptom distribution by cycle phase.
     """
     service = SymptomVisualizationService(request.user)
-    data = service.get_symptom_by_cycle_phase()
+    data = cached_visualization(request.user.pk, 'symptom_by_phase', (), service.get_symptom_by_cycle_phase)
 
     return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(
     tags=['Visualizations - Mood'],
-    parameters=[
-        OpenApiParameter(name='days', description='Number of days to analyze', required=False, type=int)
-    ]
+    parameters=[MoodTimelineParamsSerializer]
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -133,18 +140,21 @@ def mood_timeline(request):
     Query Parameters:
         - days: Number of days to include (default: 30)
     """
-    days = int(request.query_params.get('days', 30))
+    params = MoodTimelineParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    days = params.validated_data['days']
     service = MoodVisualizationService(request.user)
-    data = service.get_mood_timeline(days)
+    data = cached_visualization(
+        request.user.pk, 'mood_timeline', (days,),
+        lambda: service.get_mood_timeline(days)
+    )
 
     return Response(format_response(data), status=status.HTTP_200_OK)
 
 
 @extend_schema(
     tags=['Visualizations - Mood'],
-    parameters=[
-        OpenApiParameter(name='days', description='Number of days to analyze', required=False, type=int)
-    ]
+    parameters=[DaysParamsSerializer]
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -155,8 +165,13 @@ def mood_distribution(request):
     Query Parameters:
         - days: Number of days to include (default: 90)
     """
-    days = int(request.query_params.get('days', 90))
+    params = DaysParamsSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    days = params.validated_data['days']
     service = MoodVisualizationService(request.user)
-    data = service.get_mood_distribution(days)
+    data = cached_visualization(
+        request.user.pk, 'mood_distribution', (days,),
+        lambda: service.get_mood_distribution(days)
+    )
 
     return Response(format_response(data), status=status.HTTP_200_OK)
@@ -0,0 +1,7 @@
+"""
+Shared helpers for the Django admin.
+"""
+
+from .paginators import LargeTablePaginator
+
+__all__ = ['LargeTablePaginator']
@@ -0,0 +1,40 @@
+"""
+Paginators for admin changelists over large tables.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class LargeTablePaginator(Paginator):
+    """
+    Paginator that avoids a full COUNT(*) on large, unfiltered tables.
+
+    On PostgreSQL the row count of an unfiltered queryset is taken from the
+    planner's estimate in pg_class. Filtered querysets, small tables and
+    other databases fall back to an exact count.
+    """
+
+    # Below this many (estimated) rows an exact count is cheap enough
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        """Return the estimated or exact number of objects."""
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+
+        if query is not None and not query.where:
+            connection = connections[queryset.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples FROM pg_class WHERE relname = %s',
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.estimate_threshold:
+                    return int(row[0])
+
+        return super().count
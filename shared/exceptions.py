@@ -78,7 +78,11 @@ def custom_exception_handler(exc, context):
 
     # Handle custom application exceptions
     if isinstance(exc, BaseApplicationException):
-        logger.error(f"{exc.__class__.__name__}: {exc.message}", exc_info=True)
+        # Client errors are expected; only server errors are worth a traceback
+        if exc.status_code >= 500:
+            logger.error("%s: %s", exc.__class__.__name__, exc.message, exc_info=True)
+        else:
+            logger.warning("%s: %s", exc.__class__.__name__, exc.message)
         return Response(
             {
                 'error': {
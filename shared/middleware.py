@@ -4,30 +4,42 @@ Custom middleware for cross-cutting concerns.
 
 import logging
 import time
+from functools import lru_cache
 from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _module_of(view_module: str) -> str:
+    """Return the app module name (``modules.<name>.views`` -> ``<name>``) for a view's module."""
+    parts = view_module.split('.', 2)
+    return parts[1] if len(parts) > 1 else 'unknown'
+
+
 class RequestLoggingMiddleware(MiddlewareMixin):
     """
-    Middleware to log all incoming requests and their processing time.
+    Middleware to log slow or failed requests and their processing time.
+
+    Successful requests that finish under ``SLOW_REQUEST_SECONDS`` are not logged.
     """
 
+    SLOW_REQUEST_SECONDS = 0.5
+
     def process_request(self, request):
-        """Log the start of request processing."""
-        request.start_time = time.time()
-        logger.info(f"Started {request.method} {request.path}")
+        """Record when request processing started."""
+        request.start_time = time.perf_counter()
         return None
 
     def process_response(self, request, response):
-        """Log the completion of request processing."""
+        """Log the request if it was slow or did not succeed."""
         if hasattr(request, 'start_time'):
-            duration = time.time() - request.start_time
-            logger.info(
-                f"Completed {request.method} {request.path} "
-                f"[{response.status_code}] in {duration:.2f}s"
-            )
+            duration = time.perf_counter() - request.start_time
+            if duration > self.SLOW_REQUEST_SECONDS or response.status_code >= 400:
+                logger.info(
+                    "Completed %s %s [%s] in %.2fs",
+                    request.method, request.path, response.status_code, duration
+                )
         return response
 
 
@@ -40,6 +52,5 @@ class ModuleBoundaryMiddleware(MiddlewareMixin):
 
     def process_view(self, request, view_func, view_args, view_kwargs):
         """Track which module is handling the request."""
-        module_name = view_func.__module__.split('.')[1] if '.' in view_func.__module__ else 'unknown'
-        request.handling_module = module_name
+        request.handling_module = _module_of(view_func.__module__)
         return None
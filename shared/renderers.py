@@ -0,0 +1,34 @@
+"""
+Response renderers shared across modules.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder covers the types orjson does not handle natively (Decimal, timedelta, lazy strings)
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Output matches DRF's JSONRenderer in compact mode: UTC datetimes end in 'Z',
+    non-ASCII is emitted as UTF-8, and U+2028/U+2029 are escaped so the JSON
+    is also valid JavaScript. One difference remains: non-finite floats
+    (NaN, Infinity) are written as ``null``, where DRF raises ValueError.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Serialize ``data`` to UTF-8 encoded JSON bytes."""
+        if data is None:
+            return b''
+        ret = orjson.dumps(data, default=_fallback_encoder.default, option=self.options)
+        # In UTF-8 these byte sequences can only be the two line/paragraph separators
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')